@@ -1,12 +1,10 @@
 import streamlit as st
-import matplotlib.pyplot as plt
+import altair as alt
 import pandas as pd
-import io
 import json
-from src.ingest import read_csv, sort_records, filter_records
-from src.transform import add_computed_fields, compute_improvement
-from src.analyze import (compute_stats, grade_distribution, identify_at_risk,
-                         section_comparison, top_performers, compute_percentile)
+from src.ingest import read_csv_frame, read_csv_bytes, sort_records
+from src.transform import add_computed_fields
+from src.analyze import analytics_summary, extract_valid_grades
 
 st.set_page_config(page_title="Academic Analytics",
                    page_icon="🎓", layout="wide")
@@ -48,19 +46,91 @@ def load_config():
         }
 
 
-def process_data(source, weights, grade_scale):
-    if isinstance(source, str):
-        records, _ = read_csv(source)
+@st.cache_data
+def load_and_transform(source, weights_items, grade_scale_items):
+    if isinstance(source, bytes):
+        records, _ = read_csv_bytes(source)
     else:
-        with open("temp_upload.csv", "wb") as f:
-            f.write(source.getbuffer())
-        records, _ = read_csv("temp_upload.csv")
-    records = add_computed_fields(records, weights, grade_scale)
-    for r in records:
-        r['improvement'] = compute_improvement(r)
+        records, _ = read_csv_frame(source)
+    records = add_computed_fields(records, dict(weights_items), dict(grade_scale_items))
     return records
 
 
+@st.cache_data
+def load_analytics(records, at_risk_threshold):
+    return analytics_summary(records, at_risk_threshold)
+
+
+TABLE_FORMATS = {'Quiz': '{:.1f}', 'Midterm': '{:.0f}',
+                 'Final': '{:.0f}', 'Grade': '{:.1f}'}
+
+
+def student_table(frame, columns):
+    table = frame.assign(name=frame['first_name'] + ' ' + frame['last_name'])
+    return table[list(columns)].rename(columns=columns)
+
+
+def table_formats(table):
+    return {c: f for c, f in TABLE_FORMATS.items() if c in table.columns}
+
+
+def styled(table):
+    return table.style.format(table_formats(table), na_rep='N/A')
+
+
+# Downloads carry the same text as the on-screen tables
+def formatted(table):
+    return table.assign(**{c: table[c].map(f.format, na_action='ignore').fillna('N/A')
+                           for c, f in table_formats(table).items()})
+
+
+@st.cache_data
+def csv_bytes(table):
+    return formatted(table).to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data
+def section_csvs(records):
+    columns = {'student_id': 'ID', 'name': 'Name', 'final_grade': 'Grade'}
+    return {section: formatted(student_table(group, columns)).to_csv(index=False).encode('utf-8')
+            for section, group in records.groupby('section', sort=True)}
+
+
+GRADE_COLORS = ['#10b981', '#3b82f6', '#f59e0b', '#f97316', '#ef4444']
+
+
+# Charts are Vega-Lite specs rendered in the browser, so reruns only ship
+# the small data payload instead of rasterizing a figure server-side.
+def grade_distribution_chart(distribution):
+    grades = ['A', 'B', 'C', 'D', 'F']
+    data = pd.DataFrame({'Grade': grades,
+                         'Students': [distribution.get(g, 0) for g in grades]})
+    bars = alt.Chart(data, title='Grade Distribution').mark_bar(opacity=0.8).encode(
+        x=alt.X('Grade:N', sort=grades),
+        y=alt.Y('Students:Q'),
+        color=alt.Color('Grade:N', scale=alt.Scale(domain=grades, range=GRADE_COLORS),
+                        legend=None))
+    return bars + bars.mark_text(dy=-8, fontWeight='bold').encode(text='Students:Q')
+
+
+def score_histogram_chart(valid_grades):
+    data = pd.DataFrame({'Final Grade': valid_grades})
+    return alt.Chart(data, title='Score Distribution').mark_bar(
+        color='#8b5cf6', opacity=0.8).encode(
+        x=alt.X('Final Grade:Q', bin=alt.Bin(maxbins=20)),
+        y=alt.Y('count()', title='Frequency'))
+
+
+def section_comparison_chart(sections, means):
+    data = pd.DataFrame({'Section': sections, 'Average Grade': means})
+    bars = alt.Chart(data, title='Average by Section').mark_bar(
+        color='#667eea', opacity=0.8).encode(
+        x=alt.X('Section:N'),
+        y=alt.Y('Average Grade:Q', scale=alt.Scale(domain=[0, 100])))
+    return bars + bars.mark_text(dy=-8, fontWeight='bold').encode(
+        text=alt.Text('Average Grade:Q', format='.1f'))
+
+
 config = load_config()
 
 st.markdown('<div class="hero"><h1>🎓 Academic Analytics</h1><p>Modern Student Performance Dashboard</p></div>', unsafe_allow_html=True)
@@ -74,16 +144,21 @@ if not uploaded and not use_sample:
     st.info("👆 Upload CSV or use sample data")
     st.stop()
 
-source = "data/input.csv" if use_sample else uploaded
-records = process_data(source, config['weights'], config['grade_scale'])
-valid_grades = [r['final_grade'] for r in records if r['final_grade']]
+source = "data/input.csv" if use_sample else uploaded.getvalue()
+# The grade scale keeps its order: among equal thresholds the first letter wins
+records = load_and_transform(source, tuple(sorted(config['weights'].items())),
+                             tuple(config['grade_scale'].items()))
+valid_grades = extract_valid_grades(records)
+sections = sorted(records['section'].unique())
 
-if not valid_grades:
+if valid_grades.size == 0:
     st.error("No valid data")
     st.stop()
 
-stats = compute_stats(valid_grades)
-distribution = grade_distribution(records)
+analytics = load_analytics(records, config['thresholds']['at_risk'])
+stats = analytics['stats']
+distribution = analytics['distribution']
+at_risk = analytics['at_risk']
 
 st.success(f"✅ Loaded {len(records)} students")
 
@@ -101,69 +176,26 @@ st.markdown("### 📈 Visualizations")
 col1, col2 = st.columns(2)
 
 with col1:
-    fig, ax = plt.subplots(figsize=(8, 5))
-    grades = ['A', 'B', 'C', 'D', 'F']
-    counts = [distribution.get(g, 0) for g in grades]
-    colors = ['#10b981', '#3b82f6', '#f59e0b', '#f97316', '#ef4444']
-    bars = ax.bar(grades, counts, color=colors, alpha=0.8,
-                  edgecolor='white', linewidth=2)
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height, f'{int(height)}',
-                ha='center', va='bottom', fontweight='bold')
-    ax.set_title('Grade Distribution', fontsize=14, fontweight='bold')
-    ax.set_ylabel('Students', fontsize=11)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
-    plt.close()
+    st.altair_chart(grade_distribution_chart(distribution), use_container_width=True)
 
 with col2:
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.hist(valid_grades, bins=20, color='#8b5cf6',
-            alpha=0.8, edgecolor='white', linewidth=2)
-    ax.set_title('Score Distribution', fontsize=14, fontweight='bold')
-    ax.set_xlabel('Final Grade', fontsize=11)
-    ax.set_ylabel('Frequency', fontsize=11)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
-    plt.close()
+    st.altair_chart(score_histogram_chart(valid_grades), use_container_width=True)
 
 st.markdown("---")
 st.markdown("### 🏫 Section Performance")
 
-section_stats = section_comparison(records)
-sections = list(section_stats.keys())
+section_stats = analytics['section_stats']
 means = [section_stats[s]['mean'] for s in sections]
 
 col1, col2 = st.columns([3, 1])
 
 with col1:
-    fig, ax = plt.subplots(figsize=(10, 4))
-    bars = ax.bar(sections, means, color='#667eea',
-                  alpha=0.8, edgecolor='white', linewidth=2)
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height, f'{height:.1f}',
-                ha='center', va='bottom', fontweight='bold')
-    ax.set_title('Average by Section', fontsize=14, fontweight='bold')
-    ax.set_ylabel('Average Grade', fontsize=11)
-    ax.set_ylim(0, 100)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.grid(True, alpha=0.3)
-    st.pyplot(fig)
-    plt.close()
+    st.altair_chart(section_comparison_chart(sections, means), use_container_width=True)
 
 with col2:
     st.markdown("**Percentiles**")
-    st.metric("25th", f"{compute_percentile(valid_grades, 25):.1f}")
-    st.metric("50th", f"{compute_percentile(valid_grades, 50):.1f}")
-    st.metric("75th", f"{compute_percentile(valid_grades, 75):.1f}")
-    st.metric("90th", f"{compute_percentile(valid_grades, 90):.1f}")
+    for p, value in analytics['percentiles'].items():
+        st.metric(f"{p}th", f"{value:.1f}")
 
 st.markdown("---")
 st.markdown("### 👥 Student Rankings")
@@ -172,27 +204,19 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.markdown("**🏆 Top 10 Performers**")
-    top_10 = top_performers(records, 10)
-    top_df = pd.DataFrame([{
-        'Rank': i+1,
-        'Name': f"{r['first_name']} {r['last_name']}",
-        'Section': r['section'],
-        'Grade': f"{r['final_grade']:.1f}",
-        'Letter': r['letter_grade']
-    } for i, r in enumerate(top_10)])
-    st.dataframe(top_df, hide_index=True, use_container_width=True, height=400)
+    top_10 = analytics['top_performers']
+    top_df = student_table(top_10, {'name': 'Name', 'section': 'Section',
+                                    'final_grade': 'Grade', 'letter_grade': 'Letter'})
+    top_df.insert(0, 'Rank', range(1, len(top_df) + 1))
+    st.dataframe(styled(top_df), hide_index=True,
+                 use_container_width=True, height=400)
 
 with col2:
     st.markdown("**⚠️ At-Risk Students**")
-    at_risk = identify_at_risk(records, config['thresholds']['at_risk'])
-    if at_risk:
-        risk_df = pd.DataFrame([{
-            'Name': f"{r['first_name']} {r['last_name']}",
-            'Section': r['section'],
-            'Grade': f"{r['final_grade']:.1f}",
-            'Letter': r['letter_grade']
-        } for r in at_risk])
-        st.dataframe(risk_df, hide_index=True,
+    if not at_risk.empty:
+        risk_df = student_table(at_risk, {'name': 'Name', 'section': 'Section',
+                                          'final_grade': 'Grade', 'letter_grade': 'Letter'})
+        st.dataframe(styled(risk_df), hide_index=True,
                      use_container_width=True, height=400)
     else:
         st.success("✅ No at-risk students")
@@ -201,18 +225,12 @@ st.markdown("---")
 st.markdown("### 📋 All Students")
 
 sorted_records = sort_records(records, 'final_grade', reverse=True)
-df = pd.DataFrame([{
-    'ID': r['student_id'],
-    'Name': f"{r['first_name']} {r['last_name']}",
-    'Section': r['section'],
-    'Quiz': f"{r['quiz_average']:.1f}" if r['quiz_average'] else 'N/A',
-    'Midterm': f"{r['midterm']:.0f}" if r['midterm'] else 'N/A',
-    'Final': f"{r['final']:.0f}" if r['final'] else 'N/A',
-    'Grade': f"{r['final_grade']:.1f}" if r['final_grade'] else 'N/A',
-    'Letter': r['letter_grade']
-} for r in sorted_records])
-
-st.dataframe(df, hide_index=True, use_container_width=True, height=450)
+df = student_table(sorted_records, {
+    'student_id': 'ID', 'name': 'Name', 'section': 'Section',
+    'quiz_average': 'Quiz', 'midterm': 'Midterm', 'final': 'Final',
+    'final_grade': 'Grade', 'letter_grade': 'Letter'})
+
+st.dataframe(styled(df), hide_index=True, use_container_width=True, height=450)
 
 st.markdown("---")
 st.markdown("### 📥 Export Reports")
@@ -220,32 +238,20 @@ st.markdown("### 📥 Export Reports")
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    output = io.StringIO()
-    df.to_csv(output, index=False)
-    st.download_button("📄 All Students", output.getvalue(),
+    st.download_button("📄 All Students", csv_bytes(df),
                        "all_students.csv", use_container_width=True)
 
 with col2:
-    if at_risk:
-        output = io.StringIO()
-        risk_df.to_csv(output, index=False)
-        st.download_button("⚠️ At-Risk", output.getvalue(),
+    if not at_risk.empty:
+        st.download_button("⚠️ At-Risk", csv_bytes(risk_df),
                            "at_risk.csv", use_container_width=True)
 
 with col3:
-    output = io.StringIO()
-    top_df.to_csv(output, index=False)
-    st.download_button("🏆 Top 10", output.getvalue(),
+    st.download_button("🏆 Top 10", csv_bytes(top_df),
                        "top_10.csv", use_container_width=True)
 
 with col4:
-    section_a = filter_records(records, lambda r: r['section'] == 'A')
-    if section_a:
-        output = io.StringIO()
-        pd.DataFrame([{
-            'ID': r['student_id'],
-            'Name': f"{r['first_name']} {r['last_name']}",
-            'Grade': f"{r['final_grade']:.1f}" if r['final_grade'] else 'N/A'
-        } for r in section_a]).to_csv(output, index=False)
-        st.download_button("📊 Section A", output.getvalue(),
-                           "section_a.csv", use_container_width=True)
+    exports = section_csvs(records)
+    for section in sections:
+        st.download_button(f"📊 Section {section}", exports[section],
+                           f"section_{section.lower()}.csv", use_container_width=True)
@@ -2,21 +2,31 @@
 Academic Analytics Lite - Main Pipeline
 Course: Data Structures and Algorithms (Python)
 """
+import copy
 import json
+import os
 import time
-from src.ingest import read_csv, sort_records, filter_records
-from src.transform import add_computed_fields, compute_improvement
-from src.analyze import (compute_stats, grade_distribution, identify_at_risk,
-                         section_comparison, top_performers, find_outliers)
+from functools import lru_cache
+from src.ingest import read_csv_frame
+from src.transform import add_computed_fields
+from src.analyze import analytics_summary
 from src.reports import (print_summary, print_student_list, export_by_section,
                          export_at_risk_list, print_section_comparison)
 
 
+@lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime: float) -> dict:
+    """Parse a JSON config file; cached until its modification time changes."""
+    with open(config_path, 'rb') as f:
+        return json.loads(f.read())
+
+
 def load_config(config_path: str = 'config.json') -> dict:
     """Load configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        config = _parse_config(config_path, os.path.getmtime(config_path))
+        # Callers get their own copy so the cached config stays pristine
+        return copy.deepcopy(config)
     except Exception as e:
         print(f"Error loading config: {e}")
         return None
@@ -44,7 +54,7 @@ def main():
 
     # Ingest data
     print(f"\n[2/6] Reading data from {paths['input_folder']}/input.csv...")
-    records, errors = read_csv(f"{paths['input_folder']}/input.csv")
+    records, errors = read_csv_frame(f"{paths['input_folder']}/input.csv")
 
     if errors:
         print(f"\nWarnings/Errors during ingestion:")
@@ -57,32 +67,17 @@ def main():
     print("\n[3/6] Computing grades and transformations...")
     records = add_computed_fields(records, weights, grade_scale)
 
-    # Add improvement metric
-    for record in records:
-        record['improvement'] = compute_improvement(record)
-
     # Analyze data
     print("\n[4/6] Performing analytics...")
 
-    # Extract valid grades for statistics
-    valid_grades = [r['final_grade']
-                    for r in records if r['final_grade'] is not None]
-
-    # Compute statistics
-    stats = compute_stats(valid_grades)
-    distribution = grade_distribution(records)
-
-    # Identify at-risk students
-    at_risk = identify_at_risk(records, thresholds['at_risk'])
-
-    # Find outliers
-    outliers = find_outliers(valid_grades)
-
-    # Section comparison
-    section_stats = section_comparison(records)
-
-    # Top performers
-    top_10 = top_performers(records, 10)
+    # Statistics, distribution, at-risk, outliers, sections and top performers
+    analytics = analytics_summary(records, thresholds['at_risk'])
+    stats = analytics['stats']
+    distribution = analytics['distribution']
+    at_risk = analytics['at_risk']
+    outliers = analytics['outliers']
+    section_stats = analytics['section_stats']
+    top_10 = analytics['top_performers']
 
     # Generate reports
     print("\n[5/6] Generating reports...")
@@ -94,7 +89,7 @@ def main():
     print_section_comparison(section_stats)
 
     # Print at-risk students
-    if at_risk:
+    if not at_risk.empty:
         print_student_list(
             at_risk, f"At-Risk Students (Grade < {thresholds['at_risk']})")
 
@@ -114,7 +109,7 @@ def main():
     export_by_section(records, paths['output_folder'])
 
     # Export at-risk list
-    if at_risk:
+    if not at_risk.empty:
         export_at_risk_list(
             at_risk, f"{paths['output_folder']}/at_risk_students.csv")
 
@@ -1,25 +1,38 @@
 """
 Test runner for Academic Analytics Lite
 """
-from tests import test_transform, test_analyze
-import sys
 import os
+import sys
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import test modules
+from tests import test_ingest, test_transform, test_analyze, test_main
 
 print("="*60)
 print("RUNNING UNIT TESTS")
 print("="*60)
 
+print("\n--- Ingest Module Tests ---")
+try:
+    test_ingest.test_read_csv()
+    test_ingest.test_read_csv_frame_malformed_rows()
+    test_ingest.test_read_csv_frame_ragged_rows()
+    test_ingest.test_read_csv_frame_pyarrow()
+    test_ingest.test_read_csv_frame_chunks()
+    test_ingest.test_filter_records()
+    print("✓ All ingest tests passed!")
+except Exception as e:
+    print(f"✗ Ingest tests failed: {e}")
+
 print("\n--- Transform Module Tests ---")
 try:
     test_transform.test_compute_quiz_average()
     test_transform.test_compute_final_grade()
     test_transform.test_letter_grade()
     test_transform.test_compute_improvement()
+    test_transform.test_add_computed_fields_frame()
     print("✓ All transform tests passed!")
 except Exception as e:
     print(f"✗ Transform tests failed: {e}")
@@ -28,13 +41,24 @@ print("\n--- Analyze Module Tests ---")
 try:
     test_analyze.test_compute_stats()
     test_analyze.test_compute_percentile()
+    test_analyze.test_compute_percentiles()
     test_analyze.test_find_outliers()
     test_analyze.test_grade_distribution()
     test_analyze.test_identify_at_risk()
+    test_analyze.test_section_comparison()
+    test_analyze.test_top_performers()
+    test_analyze.test_analytics_summary()
     print("✓ All analyze tests passed!")
 except Exception as e:
     print(f"✗ Analyze tests failed: {e}")
 
+print("\n--- Main Pipeline Tests ---")
+try:
+    test_main.test_load_config()
+    print("✓ All main tests passed!")
+except Exception as e:
+    print(f"✗ Main tests failed: {e}")
+
 print("\n" + "="*60)
 print("TEST SUITE COMPLETE")
 print("="*60)
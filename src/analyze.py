@@ -2,21 +2,28 @@
 Analytics module for Academic Analytics Lite.
 Handles statistical analysis and insights.
 """
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
+from collections import Counter
+import heapq
 import math
 
+import numpy as np
+import pandas as pd
+
 
 def compute_stats(values: List[float]) -> Dict:
     """
     Compute basic statistics for a list of values.
 
     Args:
-        values: List of numeric values
+        values: List or array of numeric values
 
     Returns:
         Dictionary with mean, median, std, min, max
     """
-    if not values:
+    arr = np.asarray(values, dtype=np.float64)
+
+    if arr.size == 0:
         return {
             'count': 0,
             'mean': None,
@@ -26,29 +33,19 @@ def compute_stats(values: List[float]) -> Dict:
             'max': None
         }
 
-    n = len(values)
-    sorted_values = sorted(values)
-
-    # Mean
-    mean = sum(values) / n
-
-    # Median
-    if n % 2 == 0:
-        median = (sorted_values[n//2 - 1] + sorted_values[n//2]) / 2
-    else:
-        median = sorted_values[n//2]
-
-    # Standard deviation
-    variance = sum((x - mean) ** 2 for x in values) / n
-    std = math.sqrt(variance)
+    # Running sums add in the same order as sum(), so rounding matches the
+    # sequential formula; ndarray.mean()/std() sum pairwise
+    n = arr.size
+    mean = np.cumsum(arr)[-1] / n
+    variance = np.cumsum((arr - mean) ** 2)[-1] / n
 
     return {
-        'count': n,
-        'mean': round(mean, 2),
-        'median': round(median, 2),
-        'std': round(std, 2),
-        'min': round(min(values), 2),
-        'max': round(max(values), 2)
+        'count': int(n),
+        'mean': round(float(mean), 2),
+        'median': round(float(np.median(arr)), 2),
+        'std': round(math.sqrt(variance), 2),
+        'min': round(float(arr.min()), 2),
+        'max': round(float(arr.max()), 2)
     }
 
 
@@ -63,114 +60,148 @@ def compute_percentile(values: List[float], percentile: float) -> Optional[float
     Returns:
         Percentile value or None
     """
-    if not values:
-        return None
+    return compute_percentiles(values, [percentile])[0]
+
+
+def compute_percentiles(values: List[float], percentiles: List[float]) -> List[Optional[float]]:
+    """
+    Compute several percentiles in one pass.
+
+    Uses linear interpolation between closest ranks, partitioning the
+    values once (no full sort) for all requested percentiles.
+
+    Args:
+        values: List of numeric values
+        percentiles: Percentiles to compute (0-100)
 
-    sorted_values = sorted(values)
-    n = len(sorted_values)
+    Returns:
+        List of percentile values (None for each if values is empty)
+    """
+    if len(values) == 0:
+        return [None] * len(percentiles)
 
-    # Linear interpolation method
-    rank = (percentile / 100) * (n - 1)
-    lower = int(rank)
-    upper = min(lower + 1, n - 1)
-    weight = rank - lower
+    quantiles = np.quantile(np.asarray(values, dtype=np.float64),
+                            np.asarray(percentiles, dtype=np.float64) / 100,
+                            method='linear')
 
-    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+    return [float(q) for q in quantiles]
 
 
-def find_outliers(values: List[float], method: str = 'iqr') -> List[float]:
+def find_outliers(values: List[float], method: str = 'iqr',
+                  quartiles: Optional[Tuple[float, float]] = None) -> List[float]:
     """
     Find outliers using IQR method.
 
     Args:
         values: List of numeric values
         method: Method to use ('iqr' or 'zscore')
+        quartiles: Precomputed (q1, q3) to reuse for the IQR method
 
     Returns:
         List of outlier values
     """
-    if not values or len(values) < 4:
+    if len(values) < 4:
         return []
 
-    if method == 'iqr':
-        q1 = compute_percentile(values, 25)
-        q3 = compute_percentile(values, 75)
+    arr = np.asarray(values, dtype=np.float64)
 
-        if q1 is None or q3 is None:
-            return []
+    if method == 'iqr':
+        if quartiles is None:
+            q1, q3 = np.quantile(arr, [0.25, 0.75], method='linear')
+        else:
+            q1, q3 = quartiles
 
         iqr = q3 - q1
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
 
-        return [v for v in values if v < lower_bound or v > upper_bound]
+        return arr[(arr < lower_bound) | (arr > upper_bound)].tolist()
 
     elif method == 'zscore':
-        mean = sum(values) / len(values)
-        std = math.sqrt(sum((x - mean) ** 2 for x in values) / len(values))
+        mean = arr.mean()
+        std = arr.std()
 
         if std == 0:
             return []
 
-        return [v for v in values if abs((v - mean) / std) > 2]
+        return arr[np.abs((arr - mean) / std) > 2].tolist()
 
     return []
 
 
-def grade_distribution(records: List[Dict]) -> Dict[str, int]:
+def grade_distribution(records: Union[List[Dict], pd.DataFrame]) -> Dict[str, int]:
     """
     Compute grade distribution.
 
     Args:
-        records: Array of student records with letter_grade field
+        records: Array of student records or records DataFrame with letter_grade field
 
     Returns:
         Dictionary mapping letter grades to counts
     """
     distribution = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0, 'N/A': 0}
 
-    for record in records:
-        letter = record.get('letter_grade', 'N/A')
-        if letter in distribution:
-            distribution[letter] += 1
-        else:
-            distribution['N/A'] += 1
+    if isinstance(records, pd.DataFrame):
+        counts = records['letter_grade'].value_counts()
+        known = counts.reindex(list(distribution), fill_value=0)
+        distribution = {letter: int(count) for letter, count in known.items()}
+        # Letters outside the standard scale are reported as N/A
+        distribution['N/A'] += int(counts.sum() - known.sum())
+        return distribution
+
+    # Count in one C-level pass, then fold into the fixed buckets
+    counts = Counter(record.get('letter_grade', 'N/A') for record in records)
+    for letter, count in counts.items():
+        distribution[letter if letter in distribution else 'N/A'] += count
 
     return distribution
 
 
-def identify_at_risk(records: List[Dict], threshold: float) -> List[Dict]:
+def identify_at_risk(records: Union[List[Dict], pd.DataFrame],
+                     threshold: float) -> Union[List[Dict], pd.DataFrame]:
     """
     Identify at-risk students.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         threshold: Grade threshold for at-risk
 
     Returns:
-        Array of at-risk student records
+        Array of at-risk student records (DataFrame in, DataFrame out)
     """
-    at_risk = []
-
-    for record in records:
-        final_grade = record.get('final_grade')
-
-        if final_grade is not None and final_grade < threshold:
-            at_risk.append(record)
+    if isinstance(records, pd.DataFrame):
+        # NaN grades compare False, matching the None check below
+        return records[records['final_grade'] < threshold]
 
-    return at_risk
+    # Missing grades are filtered in the same pass as the threshold test
+    return [record for record in records
+            if record.get('final_grade') is not None
+            and record['final_grade'] < threshold]
 
 
-def section_comparison(records: List[Dict]) -> Dict[str, Dict]:
+def section_comparison(records: Union[List[Dict], pd.DataFrame]) -> Dict[str, Dict]:
     """
     Compare performance across sections.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
 
     Returns:
         Dictionary mapping section to statistics
     """
+    if isinstance(records, pd.DataFrame):
+        # One grouping pass; each section is reduced by compute_stats itself
+        # so the rounding matches the list path exactly
+        grades = records['final_grade'].to_numpy(dtype=np.float64)
+        groups = records.groupby('section', sort=False).indices
+
+        section_stats = {}
+        for section, positions in groups.items():
+            section_grades = grades[positions]
+            section_stats[section] = compute_stats(section_grades[~np.isnan(section_grades)])
+
+        return section_stats
+
     sections = {}
 
     # Group by section
@@ -192,22 +223,83 @@ def section_comparison(records: List[Dict]) -> Dict[str, Dict]:
     return section_stats
 
 
-def top_performers(records: List[Dict], n: int = 10) -> List[Dict]:
+def top_performers(records: Union[List[Dict], pd.DataFrame],
+                   n: int = 10) -> Union[List[Dict], pd.DataFrame]:
     """
     Get top N performing students.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         n: Number of top students to return
 
     Returns:
-        Array of top student records
+        Array of top student records (DataFrame in, DataFrame out)
+    """
+    if isinstance(records, pd.DataFrame):
+        # Partial selection instead of a full sort; nlargest pads with NaN
+        # rows when fewer than n grades exist, so drop those first
+        return records[records['final_grade'].notna()].nlargest(n, 'final_grade')
+
+    # Records with valid grades, filtered lazily as they are selected
+    valid_records = (r for r in records if r.get('final_grade') is not None)
+
+    # Partial selection: same result and tie order as a full descending
+    # sort truncated to n, in O(N log n)
+    return heapq.nlargest(n, valid_records, key=lambda x: x['final_grade'])
+
+
+def extract_valid_grades(records: Union[List[Dict], pd.DataFrame]) -> np.ndarray:
+    """
+    Extract the final grades that are present as a float64 array.
+
+    Args:
+        records: Array of student records or records DataFrame
+
+    Returns:
+        Array of valid final grades, in record order
     """
-    # Filter records with valid grades
-    valid_records = [r for r in records if r.get('final_grade') is not None]
+    if isinstance(records, pd.DataFrame):
+        grades = records['final_grade'].to_numpy(dtype=np.float64)
+        return grades[~np.isnan(grades)]
 
-    # Sort by final grade descending
-    sorted_records = sorted(
-        valid_records, key=lambda x: x['final_grade'], reverse=True)
+    return np.fromiter((r['final_grade'] for r in records
+                        if r.get('final_grade') is not None), dtype=np.float64)
 
-    return sorted_records[:n]
+
+def analytics_summary(records: Union[List[Dict], pd.DataFrame], at_risk_threshold: float,
+                      n_top: int = 10,
+                      percentiles: Tuple[float, ...] = (25, 50, 75, 90)) -> Dict:
+    """
+    Run the standard analytics over the records in one call.
+
+    The valid grades are extracted once into a single array shared by the
+    statistics, percentile and outlier computations.
+
+    Args:
+        records: Array of student records or records DataFrame
+        at_risk_threshold: Grade threshold for at-risk
+        n_top: Number of top students to return
+        percentiles: Percentiles to compute (0-100)
+
+    Returns:
+        Dictionary with stats, percentiles, distribution, section_stats,
+        outliers, at_risk and top_performers
+    """
+    valid_grades = extract_valid_grades(records)
+
+    percentile_values = dict(zip(percentiles, compute_percentiles(valid_grades, percentiles)))
+
+    # Reuse the quartiles for IQR outliers when they were requested anyway
+    quartiles = None
+    if 25 in percentile_values and 75 in percentile_values:
+        quartiles = (percentile_values[25], percentile_values[75])
+
+    return {
+        'stats': compute_stats(valid_grades),
+        'percentiles': percentile_values,
+        'distribution': grade_distribution(records),
+        'section_stats': section_comparison(records),
+        'outliers': find_outliers(valid_grades, quartiles=quartiles),
+        'at_risk': identify_at_risk(records, at_risk_threshold),
+        'top_performers': top_performers(records, n_top)
+    }
@@ -2,8 +2,22 @@
 Data ingestion module for Academic Analytics Lite.
 Handles CSV reading, validation, and cleaning.
 """
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, TextIO, Tuple, Union
 import csv
+import io
+from contextlib import contextmanager
+from importlib.util import find_spec
+from itertools import islice
+from operator import itemgetter
+
+import pandas as pd
+
+_STRING_FIELDS = ('student_id', 'last_name', 'first_name', 'section')
+_NUMERIC_FIELDS = ('quiz1', 'quiz2', 'quiz3', 'quiz4', 'quiz5',
+                   'midterm', 'final', 'attendance_percent')
+
+# pyarrow's multi-threaded CSV parser is used when installed
+_HAS_PYARROW = find_spec('pyarrow') is not None
 
 
 def read_csv(filepath: str) -> Tuple[List[Dict], List[str]]:
@@ -21,10 +35,25 @@ def read_csv(filepath: str) -> Tuple[List[Dict], List[str]]:
 
     try:
         with open(filepath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, start=2):
-                record, error = validate_row(row, row_num)
+            reader = csv.reader(file)
+
+            # Column offset of each field; the last duplicate header wins,
+            # as with csv.DictReader
+            header = {name: i for i, name in enumerate(next(reader, []))}
+            offsets = [header.get(field) for field in _STRING_FIELDS + _NUMERIC_FIELDS]
+
+            row_num = 1
+            for row in reader:
+                # Blank lines are skipped and not counted
+                if not row:
+                    continue
+                row_num += 1
+
+                # Absent columns read as '' and short rows as None, as
+                # row.get() does on a DictReader row
+                values = ['' if i is None else row[i] if i < len(row) else None
+                          for i in offsets]
+                record, error = _validate_values(values, row_num)
 
                 if error:
                     errors.append(error)
@@ -40,6 +69,298 @@ def read_csv(filepath: str) -> Tuple[List[Dict], List[str]]:
     return records, errors
 
 
+def read_csv_frame(source, nrows: Optional[int] = None,
+                   chunksize: Optional[int] = None) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Read CSV data into a single DataFrame of student records.
+
+    Columnar counterpart of read_csv: string fields are stripped and numeric
+    fields become float64 columns, with NaN for missing or invalid values.
+
+    Args:
+        source: Path to CSV file, or binary or text file-like object
+        nrows: Only read this many data rows (None = all), e.g. for a preview
+        chunksize: Parse and validate this many rows at a time (None = all
+            at once), bounding the raw text held in memory for large files
+
+    Returns:
+        Tuple of (records_frame, error_messages)
+    """
+    errors = []
+    columns = list(_STRING_FIELDS + _NUMERIC_FIELDS)
+    frames = []
+    row_errors = []
+
+    try:
+        # pyarrow's reader supports neither nrows, chunksize nor text streams
+        if not (_HAS_PYARROW and nrows is None and chunksize is None
+                and not isinstance(source, io.TextIOBase)):
+            raws = _read_rows(source, nrows, chunksize)
+        else:
+            try:
+                raws = [_read_arrow(source)]
+            except pd.errors.ParserError:
+                # pyarrow rejects the whole file over a single short or long
+                # row; re-read it leniently so such rows are reported one by one
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+                raws = _read_rows(source)
+
+        for raw in raws:
+            frame, chunk_errors = _validate_frame(raw)
+            frames.append(frame)
+            row_errors.extend(chunk_errors)
+    except FileNotFoundError:
+        errors.append(f"File not found: {source}")
+    except pd.errors.EmptyDataError:
+        # An empty file has no records and, as for read_csv, no errors
+        pass
+    except Exception as e:
+        errors.append(f"Error reading file: {str(e)}")
+
+    if not frames:
+        frames.append(_validate_frame(pd.DataFrame(columns=columns, dtype=str))[0])
+
+    errors.extend(message for _, message in sorted(row_errors))
+
+    return pd.concat(frames, ignore_index=True), errors
+
+
+def _read_arrow(source) -> pd.DataFrame:
+    """
+    Read a whole CSV file as raw text columns with pyarrow's CSV parser.
+
+    Every column is read as a non-null string, so values keep the exact text
+    read_csv sees; pd.read_csv's pyarrow engine infers column types first and
+    would read '00123' as '123'. As in read_csv, the last duplicate header
+    wins and absent columns are left to _validate_frame.
+
+    Args:
+        source: Path to CSV file or binary file-like object
+
+    Returns:
+        DataFrame of CSV text with one column per field found in the header
+
+    Raises:
+        pd.errors.ParserError: If a row has too few or too many fields
+        pd.errors.EmptyDataError: If the file has no header
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    header = _read_header(source)
+    if not header:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+
+    # Columns are named by position, since header names may repeat
+    names = [str(i) for i in range(len(header))]
+    offsets = {name: i for i, name in enumerate(header)}
+    fields = [field for field in _STRING_FIELDS + _NUMERIC_FIELDS if field in offsets]
+
+    try:
+        table = pa_csv.read_csv(
+            source,
+            read_options=pa_csv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                include_columns=[names[offsets[field]] for field in fields],
+                null_values=[], strings_can_be_null=False,
+                quoted_strings_can_be_null=False))
+    except pa.ArrowInvalid as e:
+        raise pd.errors.ParserError(str(e)) from e
+
+    return table.to_pandas().set_axis(fields, axis=1)
+
+
+def _read_rows(source, nrows: Optional[int] = None,
+               chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read CSV rows with csv.reader as raw text frames, exactly as read_csv does.
+
+    Blank lines are skipped and not counted, whitespace-only lines are rows,
+    fields missing from short rows read as None, extra fields are ignored and
+    the last duplicate header wins.
+
+    Args:
+        source: Path to CSV file, or binary or text file-like object
+        nrows: Only read this many data rows (None = all)
+        chunksize: Yield frames of this many rows (None = one frame)
+
+    Yields:
+        DataFrames of CSV text with one column per field found in the header,
+        indexed by data row (0 = first data row)
+    """
+    with _text_stream(source) as file:
+        reader = csv.reader(file)
+        header = {name: i for i, name in enumerate(next(reader, []))}
+        fields = [field for field in _STRING_FIELDS + _NUMERIC_FIELDS if field in header]
+        offsets = [header[field] for field in fields]
+        width = max(offsets, default=-1) + 1
+
+        # Rows that have every wanted field take the itemgetter fast path
+        if len(offsets) > 1:
+            get = itemgetter(*offsets)
+        else:
+            def get(row):
+                return tuple(row[i] for i in offsets)
+
+        rows = islice((row for row in reader if row), nrows)
+        start = 0
+
+        while True:
+            chunk = [get(row) if len(row) >= width
+                     else tuple(row[i] if i < len(row) else None for i in offsets)
+                     for row in islice(rows, chunksize)]
+            if not chunk:
+                break
+
+            yield pd.DataFrame(chunk, columns=fields, dtype=str,
+                               index=range(start, start + len(chunk)))
+            start += len(chunk)
+
+
+def _read_header(source) -> List[str]:
+    """
+    Read the header row of a CSV file, rewinding file-like sources.
+
+    Args:
+        source: Path to CSV file, or binary or text file-like object
+
+    Returns:
+        Header field names ([] for an empty file)
+    """
+    with _text_stream(source) as file:
+        header = next(csv.reader(file), [])
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+    return header
+
+
+@contextmanager
+def _text_stream(source) -> Iterator[TextIO]:
+    """
+    Open a CSV source as a text stream.
+
+    Paths are opened as UTF-8 and closed afterwards; binary file-like
+    objects are decoded as UTF-8 and left open; text streams such as
+    io.StringIO are used as they are.
+
+    Args:
+        source: Path to CSV file, or binary or text file-like object
+
+    Yields:
+        Text stream positioned at the source's current offset
+    """
+    if isinstance(source, io.TextIOBase):
+        yield source
+    elif hasattr(source, 'read'):
+        text = io.TextIOWrapper(source, encoding='utf-8')
+        try:
+            yield text
+        finally:
+            text.detach()
+    else:
+        with open(source, 'r', encoding='utf-8') as file:
+            yield file
+
+
+def _validate_frame(raw: pd.DataFrame) -> Tuple[pd.DataFrame, List[Tuple[int, str]]]:
+    """
+    Validate and clean raw CSV text columns, the columnar validate_row.
+
+    Clean rows are converted column-wise; rows with any problem go through
+    _validate_values, so they are kept, truncated or dropped with exactly
+    the errors read_csv reports.
+
+    Args:
+        raw: DataFrame of CSV text, indexed by data row (0 = first data row),
+            NaN for fields missing from short rows
+
+    Returns:
+        Tuple of (cleaned_frame, [(row_num, error_message)])
+    """
+    columns = list(_STRING_FIELDS + _NUMERIC_FIELDS)
+
+    # Absent columns read as '', as row.get() does on a DictReader row
+    raw = raw.reindex(columns=columns, fill_value='')
+    text = {column: raw[column].str.strip() for column in columns}
+
+    frame = pd.DataFrame({field: text[field] for field in _STRING_FIELDS})
+    clean = frame.notna().all(axis=1) & (text['student_id'] != '')
+
+    for field in _NUMERIC_FIELDS:
+        values = _parse_scores(text[field])
+        clean &= (text[field] == '') | ((values >= 0) & (values <= 100))
+        frame[field] = values
+
+    frame = frame[clean]
+    row_errors = []
+
+    if not clean.all():
+        records = []
+        rows = raw.loc[~clean, columns]
+
+        for index, values in zip(rows.index, rows.itertuples(index=False, name=None)):
+            row_num = index + 2
+            record, error = _validate_values(
+                [None if pd.isna(value) else value for value in values], row_num)
+
+            if error:
+                row_errors.append((row_num, error))
+
+            if record:
+                records.append((index, record))
+
+        if records:
+            fixed = pd.DataFrame([record for _, record in records],
+                                 index=[index for index, _ in records], columns=columns)
+            frame = pd.concat([frame, fixed.astype(frame.dtypes.to_dict())]).sort_index()
+
+    return frame, row_errors
+
+
+def _parse_scores(text: pd.Series) -> pd.Series:
+    """
+    Parse a stripped score column to float64 exactly as float() does.
+
+    Args:
+        text: Stripped CSV text, '' or NaN where missing
+
+    Returns:
+        float64 Series, NaN where missing or not a number
+    """
+    present = text.where(text != '')
+
+    try:
+        return present.astype('float64')
+    except ValueError:
+        return present.map(_to_float, na_action='ignore').astype('float64')
+
+
+def _to_float(value: str) -> float:
+    """float(value), or NaN if it is not a number."""
+    try:
+        return float(value)
+    except ValueError:
+        return float('nan')
+
+
+def read_csv_bytes(data: bytes) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Read in-memory CSV bytes (e.g. an upload) without touching the disk.
+
+    Args:
+        data: Raw CSV file contents
+
+    Returns:
+        Tuple of (records_frame, error_messages)
+    """
+    return read_csv_frame(io.BytesIO(data))
+
+
 def validate_row(row: Dict, row_num: int) -> Tuple[Optional[Dict], Optional[str]]:
     """
     Validate and clean a single row of data.
@@ -48,29 +369,41 @@ def validate_row(row: Dict, row_num: int) -> Tuple[Optional[Dict], Optional[str]
         row: Dictionary from CSV reader
         row_num: Row number for error reporting
 
+    Returns:
+        Tuple of (cleaned_record, error_message)
+    """
+    return _validate_values([row.get(field, '') for field in _STRING_FIELDS + _NUMERIC_FIELDS],
+                            row_num)
+
+
+def _validate_values(values: List[str], row_num: int) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Validate and clean a single row given as raw field values.
+
+    Args:
+        values: Raw values of _STRING_FIELDS followed by _NUMERIC_FIELDS
+        row_num: Row number for error reporting
+
     Returns:
         Tuple of (cleaned_record, error_message)
     """
     try:
         # Required fields
-        student_id = row.get('student_id', '').strip()
+        student_id = values[0].strip()
         if not student_id:
             return None, f"Row {row_num}: Missing student_id"
 
         # Clean string fields
         record = {
             'student_id': student_id,
-            'last_name': row.get('last_name', '').strip(),
-            'first_name': row.get('first_name', '').strip(),
-            'section': row.get('section', '').strip()
+            'last_name': values[1].strip(),
+            'first_name': values[2].strip(),
+            'section': values[3].strip()
         }
 
         # Parse numeric fields with validation
-        numeric_fields = ['quiz1', 'quiz2', 'quiz3', 'quiz4', 'quiz5',
-                          'midterm', 'final', 'attendance_percent']
-
-        for field in numeric_fields:
-            value = row.get(field, '').strip()
+        for field, value in zip(_NUMERIC_FIELDS, values[len(_STRING_FIELDS):]):
+            value = value.strip()
 
             if value == '':
                 record[field] = None
@@ -95,17 +428,37 @@ def validate_row(row: Dict, row_num: int) -> Tuple[Optional[Dict], Optional[str]
         return None, f"Row {row_num}: Validation error: {str(e)}"
 
 
-def filter_records(records: List[Dict], condition_func) -> List[Dict]:
+def filter_records(records: Union[List[Dict], pd.DataFrame],
+                   condition_func) -> Union[List[Dict], pd.DataFrame]:
     """
     Filter records based on a condition function.
 
+    For a DataFrame the condition is called once on the whole frame and must
+    return a boolean mask, so write it column-wise, e.g.
+    ``lambda r: r['section'] == 'A'`` or ``lambda r: r['final_grade'] < 60``.
+
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         condition_func: Function that returns True for records to keep
 
     Returns:
-        Filtered array of records
+        Filtered array of records (DataFrame in, DataFrame out)
+
+    Raises:
+        TypeError: If condition_func does not return a boolean Series for
+            a DataFrame
     """
+    if isinstance(records, pd.DataFrame):
+        mask = condition_func(records)
+
+        # A per-record predicate such as ``r['x'] is not None`` evaluates to
+        # a plain bool on a frame; reject it rather than index with it
+        if not (isinstance(mask, pd.Series) and pd.api.types.is_bool_dtype(mask)):
+            raise TypeError("condition_func must return a boolean Series for a "
+                            f"DataFrame, got {type(mask).__name__}")
+
+        return records[mask]
+
     return [record for record in records if condition_func(record)]
 
 
@@ -123,18 +476,22 @@ def project_fields(records: List[Dict], fields: List[str]) -> List[Dict]:
     return [{field: record.get(field) for field in fields} for record in records]
 
 
-def sort_records(records: List[Dict], key_field: str, reverse: bool = False) -> List[Dict]:
+def sort_records(records: Union[List[Dict], pd.DataFrame], key_field: str,
+                 reverse: bool = False) -> Union[List[Dict], pd.DataFrame]:
     """
     Sort records by a specific field.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         key_field: Field name to sort by
         reverse: Sort in descending order if True
 
     Returns:
-        Sorted array of records
+        Sorted array of records (DataFrame in, DataFrame out)
     """
+    if isinstance(records, pd.DataFrame):
+        return records.sort_values(key_field, ascending=not reverse, kind='stable')
+
     return sorted(records, key=lambda x: x.get(key_field, 0), reverse=reverse)
 
 
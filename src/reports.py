@@ -2,9 +2,12 @@
 Reporting module for Academic Analytics Lite.
 Handles output generation and exports.
 """
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 import csv
 import os
+import sys
+
+import pandas as pd
 
 
 def print_summary(records: List[Dict], stats: Dict, distribution: Dict) -> None:
@@ -42,45 +45,88 @@ def print_summary(records: List[Dict], stats: Dict, distribution: Dict) -> None:
     print("\n" + "="*60 + "\n")
 
 
-def print_student_list(records: List[Dict], title: str = "Student List") -> None:
+def print_student_list(records: Union[List[Dict], pd.DataFrame],
+                       title: str = "Student List") -> None:
     """
     Print formatted student list.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         title: Title for the list
     """
-    print(f"\n--- {title} ---")
-    print(f"{'ID':<10} {'Name':<25} {'Section':<10} {'Final Grade':<12} {'Letter':<8}")
-    print("-" * 75)
+    if isinstance(records, pd.DataFrame):
+        # Read the columns directly; NaN grades print as N/A
+        columns = [_column(records, 'student_id', 'N/A'),
+                   _column(records, 'first_name', ''),
+                   _column(records, 'last_name', ''),
+                   _column(records, 'section', 'N/A'),
+                   _column(records, 'final_grade', None),
+                   _column(records, 'letter_grade', 'N/A')]
+        rows = [_student_row(*values) for values in zip(*columns)]
+    else:
+        rows = [_student_row(record.get('student_id', 'N/A'),
+                             record.get('first_name', ''),
+                             record.get('last_name', ''),
+                             record.get('section', 'N/A'),
+                             record.get('final_grade'),
+                             record.get('letter_grade', 'N/A'))
+                for record in records]
 
-    for record in records:
-        student_id = record.get('student_id', 'N/A')
-        name = f"{record.get('first_name', '')} {record.get('last_name', '')}".strip(
-        )
-        section = record.get('section', 'N/A')
-        final_grade = record.get('final_grade')
-        letter = record.get('letter_grade', 'N/A')
+    header = f"{'ID':<10} {'Name':<25} {'Section':<10} {'Final Grade':<12} {'Letter':<8}"
 
-        grade_str = f"{final_grade:.2f}" if final_grade is not None else "N/A"
+    # One write for the whole list instead of a print per row
+    sys.stdout.write("\n".join([f"\n--- {title} ---", header, "-" * 75, *rows, "\n"]))
 
-        print(f"{student_id:<10} {name:<25} {section:<10} {grade_str:<12} {letter:<8}")
 
-    print()
+def _column(frame: pd.DataFrame, field: str, default) -> List:
+    """
+    Extract a DataFrame column as a list, NaN becoming None.
 
+    Args:
+        frame: Records DataFrame
+        field: Column name
+        default: Value for every row if the column is missing
 
-def export_to_csv(records: List[Dict], filepath: str, fields: List[str] = None) -> bool:
+    Returns:
+        List of column values
+    """
+    if field not in frame:
+        return [default] * len(frame)
+
+    column = frame[field]
+    return column.astype(object).where(column.notna(), None).tolist()
+
+
+def _student_row(student_id, first_name, last_name, section,
+                 final_grade: Optional[float], letter) -> str:
+    """
+    Format one print_student_list row.
+
+    Returns:
+        Formatted row
+    """
+    name = f"{first_name} {last_name}".strip()
+    grade_str = f"{final_grade:.2f}" if final_grade is not None else "N/A"
+
+    return f"{student_id:<10} {name:<25} {section:<10} {grade_str:<12} {letter:<8}"
+
+
+def export_to_csv(records: Union[List[Dict], pd.DataFrame], filepath: str,
+                  fields: List[str] = None) -> bool:
     """
     Export records to CSV file.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         filepath: Output file path
         fields: List of fields to export (None = all)
 
     Returns:
         True if successful, False otherwise
     """
+    if isinstance(records, pd.DataFrame):
+        return _export_frame_to_csv(records, filepath, fields)
+
     if not records:
         print(f"No records to export to {filepath}")
         return False
@@ -107,14 +153,58 @@ def export_to_csv(records: List[Dict], filepath: str, fields: List[str] = None)
         return False
 
 
-def export_by_section(records: List[Dict], output_folder: str) -> None:
+def _export_frame_to_csv(frame: pd.DataFrame, filepath: str,
+                         fields: List[str] = None) -> bool:
+    """
+    export_to_csv for a records DataFrame, written by the pandas C writer.
+
+    Output matches csv.DictWriter: missing fields and NaN become empty
+    cells and lines end with CRLF.
+
+    Args:
+        frame: Records DataFrame
+        filepath: Output file path
+        fields: List of fields to export (None = all)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if frame.empty:
+        print(f"No records to export to {filepath}")
+        return False
+
+    try:
+        # Create directory if needed
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        if fields is not None:
+            frame = frame.reindex(columns=fields)
+
+        frame.to_csv(filepath, index=False, encoding='utf-8', lineterminator='\r\n')
+
+        print(f"Exported {len(frame)} records to {filepath}")
+        return True
+
+    except Exception as e:
+        print(f"Error exporting to {filepath}: {str(e)}")
+        return False
+
+
+def export_by_section(records: Union[List[Dict], pd.DataFrame], output_folder: str) -> None:
     """
     Export separate CSV files for each section.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         output_folder: Output folder path
     """
+    if isinstance(records, pd.DataFrame):
+        # Write each section's rows straight from the frame
+        for section, section_records in records.groupby('section', sort=False):
+            filepath = os.path.join(output_folder, f"section_{section}.csv")
+            export_to_csv(section_records, filepath)
+        return
+
     # Group by section
     sections = {}
     for record in records:
@@ -130,12 +220,12 @@ def export_by_section(records: List[Dict], output_folder: str) -> None:
         export_to_csv(section_records, filepath)
 
 
-def export_at_risk_list(records: List[Dict], filepath: str) -> bool:
+def export_at_risk_list(records: Union[List[Dict], pd.DataFrame], filepath: str) -> bool:
     """
     Export at-risk students to CSV.
 
     Args:
-        records: Array of at-risk student records
+        records: Array or DataFrame of at-risk student records
         filepath: Output file path
 
     Returns:
@@ -2,7 +2,13 @@
 Data transformation module for Academic Analytics Lite.
 Handles grade calculations and transformations.
 """
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+QUIZ_FIELDS = ['quiz1', 'quiz2', 'quiz3', 'quiz4', 'quiz5']
 
 
 def compute_quiz_average(record: Dict) -> Optional[float]:
@@ -15,9 +21,8 @@ def compute_quiz_average(record: Dict) -> Optional[float]:
     Returns:
         Average quiz score or None if no valid quizzes
     """
-    quiz_fields = ['quiz1', 'quiz2', 'quiz3', 'quiz4', 'quiz5']
     quiz_scores = [record.get(field)
-                   for field in quiz_fields if record.get(field) is not None]
+                   for field in QUIZ_FIELDS if record.get(field) is not None]
 
     if not quiz_scores:
         return None
@@ -82,50 +87,177 @@ def letter_grade(numeric_grade: Optional[float], grade_scale: Dict) -> str:
     Returns:
         Letter grade
     """
-    if numeric_grade is None:
-        return 'N/A'
+    return _letter_grader(grade_scale)(numeric_grade)
 
-    # Sort grades by threshold descending
-    sorted_grades = sorted(grade_scale.items(),
-                           key=lambda x: x[1], reverse=True)
 
-    for letter, threshold in sorted_grades:
-        if numeric_grade >= threshold:
-            return letter
+def _letter_grader(grade_scale: Dict) -> Callable[[Optional[float]], str]:
+    """
+    Build a letter_grade function with the grade scale sorted once.
 
-    return 'F'
+    Args:
+        grade_scale: Dictionary mapping letters to minimum scores
 
+    Returns:
+        Function mapping a numeric grade (or None) to its letter grade
+    """
+    # Ascending thresholds; among equal thresholds the first letter in the
+    # scale sorts last, so it wins as it did in the descending scan
+    scale = sorted(grade_scale.items(), key=lambda x: x[1], reverse=True)[::-1]
+    thresholds = [threshold for _, threshold in scale]
+    letters = [letter for letter, _ in scale]
 
-def add_computed_fields(records: List[Dict], weights: Dict, grade_scale: Dict) -> List[Dict]:
+    def grade(numeric_grade: Optional[float]) -> str:
+        if numeric_grade is None:
+            return 'N/A'
+
+        # NaN reaches no threshold in the descending scan; bisect would
+        # place it past them all
+        if numeric_grade != numeric_grade:
+            return 'F'
+
+        idx = bisect_right(thresholds, numeric_grade)
+        return letters[idx - 1] if idx else 'F'
+
+    return grade
+
+
+def add_computed_fields(records: Union[List[Dict], pd.DataFrame], weights: Dict,
+                        grade_scale: Dict) -> Union[List[Dict], pd.DataFrame]:
     """
     Add computed fields to all records.
 
     Args:
-        records: Array of student records
+        records: Array of student records or records DataFrame
         weights: Weight configuration
         grade_scale: Grade scale configuration
 
     Returns:
-        Records with added computed fields
+        Records with added computed fields (DataFrame in, DataFrame out)
     """
+    if isinstance(records, pd.DataFrame):
+        return _add_computed_columns(records, weights, grade_scale)
+
+    grade_letter = _letter_grader(grade_scale)
     enhanced_records = []
 
     for record in records:
-        enhanced = record.copy()
+        final_grade = compute_final_grade(record, weights)
 
-        # Add quiz average
-        enhanced['quiz_average'] = compute_quiz_average(record)
+        # Build each enhanced record in one dict display rather than
+        # copying the record and growing the copy key by key
+        enhanced_records.append({
+            **record,
+            'quiz_average': compute_quiz_average(record),
+            'final_grade': final_grade,
+            'letter_grade': grade_letter(final_grade),
+            'improvement': compute_improvement(record),
+        })
 
-        # Add final grade
-        final_grade = compute_final_grade(record, weights)
-        enhanced['final_grade'] = final_grade
+    return enhanced_records
 
-        # Add letter grade
-        enhanced['letter_grade'] = letter_grade(final_grade, grade_scale)
 
-        enhanced_records.append(enhanced)
+def _letter_grades(grades: np.ndarray, grade_scale: Dict) -> np.ndarray:
+    """
+    Vectorized letter_grade over an array of numeric grades.
 
-    return enhanced_records
+    Args:
+        grades: Numeric grades, NaN where missing
+        grade_scale: Dictionary mapping letters to minimum scores
+
+    Returns:
+        Array of letter grades
+    """
+    # Ascending thresholds built as in _letter_grader, so the first letter
+    # in the scale wins among equal thresholds
+    scale = sorted(grade_scale.items(), key=lambda x: x[1], reverse=True)[::-1]
+    thresholds = np.array([threshold for _, threshold in scale], dtype=np.float64)
+
+    # Grades below every threshold (or with an empty scale) get 'F', as in
+    # _letter_grader; searchsorted gives 0 for them and i + 1 for a grade
+    # reaching threshold i
+    letters = np.array(['F'] + [letter for letter, _ in scale], dtype=object)
+    result = letters[np.searchsorted(thresholds, grades, side='right')]
+
+    return np.where(np.isnan(grades), 'N/A', result).astype(object)
+
+
+def _improvement(final: np.ndarray, midterm: np.ndarray) -> np.ndarray:
+    """
+    Vectorized compute_improvement over final and midterm arrays.
+
+    Args:
+        final: Final exam scores, NaN where missing
+        midterm: Midterm scores, NaN where missing
+
+    Returns:
+        Improvement percentages, NaN where missing or midterm is zero
+    """
+    improvement = np.full(midterm.shape, np.nan)
+    np.divide(final - midterm, midterm, out=improvement, where=midterm != 0)
+    improvement *= 100
+
+    return improvement
+
+
+def _add_computed_columns(frame: pd.DataFrame, weights: Dict, grade_scale: Dict) -> pd.DataFrame:
+    """
+    Vectorized add_computed_fields over a records DataFrame.
+
+    Mirrors compute_quiz_average, compute_final_grade, letter_grade and
+    compute_improvement column-wise; missing values are NaN instead of None.
+
+    Args:
+        frame: Records DataFrame
+        weights: Weight configuration
+        grade_scale: Grade scale configuration
+
+    Returns:
+        Copy of the frame with quiz_average, final_grade, letter_grade
+        and improvement
+    """
+    # Work on contiguous float64 columns rather than pandas Series
+    quizzes = frame[QUIZ_FIELDS].to_numpy(dtype=np.float64)
+    midterm = frame['midterm'].to_numpy(dtype=np.float64)
+    final = frame['final'].to_numpy(dtype=np.float64)
+    attendance = frame['attendance_percent'].to_numpy(dtype=np.float64)
+
+    # Average of the quizzes present; NaN when none were taken. Quizzes are
+    # added column by column, in the same order as compute_quiz_average's
+    # sum(), so both paths round identically
+    quiz_sum = np.zeros(len(frame))
+    quiz_count = np.zeros(len(frame))
+    for quiz in quizzes.T:
+        taken = ~np.isnan(quiz)
+        np.add(quiz_sum, quiz, out=quiz_sum, where=taken)
+        quiz_count += taken
+    quiz_avg = np.full(len(frame), np.nan)
+    np.divide(quiz_sum, quiz_count, out=quiz_avg, where=quiz_count > 0)
+
+    # Missing quiz/attendance components drop out of the weighted sum;
+    # accumulate in place to keep temporaries to one per term
+    grade = np.multiply(quiz_avg, weights['quizzes'])
+    total_weight = np.where(np.isnan(grade), 0.0, weights['quizzes'])
+    np.nan_to_num(grade, copy=False)
+    grade += midterm * weights['midterm']
+    grade += final * weights['final']
+    total_weight += weights['midterm']
+    total_weight += weights['final']
+
+    weighted_attendance = np.multiply(attendance, weights['attendance'])
+    has_attendance = ~np.isnan(weighted_attendance)
+    np.add(grade, weighted_attendance, out=grade, where=has_attendance)
+    np.add(total_weight, weights['attendance'], out=total_weight, where=has_attendance)
+
+    # Normalize if missing components; NaN midterm/final propagate
+    final_grade = np.full(len(frame), np.nan)
+    np.divide(grade, total_weight, out=final_grade, where=total_weight > 0)
+    final_grade *= (weights['quizzes'] + weights['midterm'] +
+                    weights['final'] + weights['attendance'])
+
+    return frame.assign(quiz_average=quiz_avg,
+                        final_grade=final_grade,
+                        letter_grade=_letter_grades(final_grade, grade_scale),
+                        improvement=_improvement(final, midterm))
 
 
 def compute_improvement(record: Dict) -> Optional[float]:
@@ -1,12 +1,18 @@
 """
 Unit tests for analyze module.
 """
-from src.analyze import (compute_stats, compute_percentile, find_outliers,
-                         grade_distribution, identify_at_risk)
-import sys
 import os
+import sys
+
+import pandas as pd
+
+# Make the project root importable when run as a script
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.analyze import (compute_stats, compute_percentile, compute_percentiles,
+                         find_outliers, grade_distribution, identify_at_risk,
+                         section_comparison, top_performers, extract_valid_grades, analytics_summary)
+
 
 def test_compute_stats():
     """Test statistics computation."""
@@ -19,6 +25,14 @@ def test_compute_stats():
     assert stats['min'] == 70.0
     assert stats['max'] == 100.0
 
+    # Values are summed in order, as sum(values) / n does; a pairwise sum
+    # lands on 49.925 and rounds down
+    values = [56.82, 13.78, 12.33, 12.05, 40.12, 46.79, 55.96, 29.9, 63.21, 74.23,
+              21.8, 48.89, 50.16, 49.27, 95.84, 44.4, 14.28, 49.55, 88.73, 21.57,
+              35.54, 39.1, 99.29, 84.62, 97.89, 68.69, 8.14, 94.93, 92.46, 39.51,
+              36.13, 11.62]
+    assert compute_stats(values)['mean'] == round(sum(values) / len(values), 2) == 49.93
+
     # Empty list
     stats = compute_stats([])
     assert stats['mean'] is None
@@ -45,6 +59,22 @@ def test_compute_percentile():
     print("✓ test_compute_percentile passed")
 
 
+def test_compute_percentiles():
+    """Test batched percentile calculation."""
+    values = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+    percentiles = [25, 50, 75, 90]
+
+    # Linear interpolation between closest ranks
+    result = compute_percentiles(values, percentiles)
+    for value, expected in zip(result, [32.5, 55.0, 77.5, 91.0]):
+        assert abs(value - expected) < 1e-9
+
+    # Empty list
+    assert compute_percentiles([], [25, 75]) == [None, None]
+
+    print("✓ test_compute_percentiles passed")
+
+
 def test_find_outliers():
     """Test outlier detection."""
     # Normal distribution with outliers
@@ -54,6 +84,14 @@ def test_find_outliers():
     assert len(outliers) > 0
     assert 95 in outliers or 10 in outliers
 
+    # Precomputed quartiles give the same result
+    quartiles = (compute_percentile(values, 25), compute_percentile(values, 75))
+    assert find_outliers(values, quartiles=quartiles) == outliers
+
+    # Z-score method flags values more than 2 std from the mean
+    assert find_outliers(values, method='zscore') == [95, 10]
+    assert find_outliers([70, 70, 70, 70], method='zscore') == []
+
     # No outliers
     values = [50, 52, 54, 56, 58, 60, 62, 64, 66, 68]
     outliers = find_outliers(values, method='iqr')
@@ -79,6 +117,9 @@ def test_grade_distribution():
     assert dist['D'] == 0
     assert dist['F'] == 1
 
+    # DataFrame input gives the same counts
+    assert grade_distribution(pd.DataFrame(records)) == dist
+
     print("✓ test_grade_distribution passed")
 
 
@@ -99,10 +140,91 @@ def test_identify_at_risk():
     print("✓ test_identify_at_risk passed")
 
 
+def test_section_comparison():
+    """Test per-section statistics."""
+    records = [
+        {'section': 'B', 'final_grade': 21.74},
+        {'section': 'A', 'final_grade': 80},
+        {'section': 'B', 'final_grade': 45.39},
+        {'section': 'C', 'final_grade': None},
+    ]
+
+    sections = section_comparison(records)
+    assert list(sections) == ['B', 'A', 'C']
+    assert sections['B'] == compute_stats([21.74, 45.39])
+    assert sections['B']['std'] == 11.82
+    assert sections['C']['count'] == 0 and sections['C']['mean'] is None
+
+    # DataFrame input rounds exactly like compute_stats
+    assert section_comparison(pd.DataFrame(records)) == sections
+
+    print("✓ test_section_comparison passed")
+
+
+def test_top_performers():
+    """Test top performer selection."""
+    records = [
+        {'student_id': '1', 'final_grade': 72},
+        {'student_id': '2', 'final_grade': None},
+        {'student_id': '3', 'final_grade': 91},
+        {'student_id': '4', 'final_grade': 85},
+        {'student_id': '5', 'final_grade': 91},
+    ]
+
+    top = top_performers(records, 3)
+    assert [r['student_id'] for r in top] == ['3', '5', '4']
+
+    # DataFrame input selects the same students in the same order
+    top = top_performers(pd.DataFrame(records), 3)
+    assert top['student_id'].tolist() == ['3', '5', '4']
+
+    # Students without a grade are never listed, even when n exceeds the
+    # number of valid grades
+    top = top_performers(records, 10)
+    assert [r['student_id'] for r in top] == ['3', '5', '4', '1']
+
+    top = top_performers(pd.DataFrame(records), 10)
+    assert top['student_id'].tolist() == ['3', '5', '4', '1']
+
+    print("✓ test_top_performers passed")
+
+
+def test_analytics_summary():
+    """Test the combined analytics call."""
+    records = [
+        {'student_id': '1', 'section': 'A', 'final_grade': 55, 'letter_grade': 'F'},
+        {'student_id': '2', 'section': 'B', 'final_grade': 75, 'letter_grade': 'C'},
+        {'student_id': '3', 'section': 'A', 'final_grade': None, 'letter_grade': 'N/A'},
+        {'student_id': '4', 'section': 'B', 'final_grade': 85, 'letter_grade': 'B'},
+    ]
+
+    assert extract_valid_grades(records).tolist() == [55, 75, 85]
+    assert extract_valid_grades(pd.DataFrame(records)).tolist() == [55, 75, 85]
+
+    summary = analytics_summary(records, at_risk_threshold=60, n_top=2)
+    assert summary['stats'] == compute_stats([55, 75, 85])
+    assert summary['distribution'] == grade_distribution(records)
+    assert summary['percentiles'][50] == 75.0
+    assert [r['student_id'] for r in summary['at_risk']] == ['1']
+    assert [r['student_id'] for r in summary['top_performers']] == ['4', '2']
+    assert summary['section_stats']['A']['count'] == 1
+
+    # DataFrame input gives the same aggregates
+    frame_summary = analytics_summary(pd.DataFrame(records), at_risk_threshold=60, n_top=2)
+    assert frame_summary['stats'] == summary['stats']
+    assert frame_summary['section_stats'] == summary['section_stats']
+
+    print("✓ test_analytics_summary passed")
+
+
 if __name__ == "__main__":
     test_compute_stats()
     test_compute_percentile()
+    test_compute_percentiles()
     test_find_outliers()
     test_grade_distribution()
     test_identify_at_risk()
+    test_section_comparison()
+    test_top_performers()
+    test_analytics_summary()
     print("\n✓ All analyze tests passed!")
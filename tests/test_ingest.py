@@ -0,0 +1,275 @@
+"""
+Unit tests for ingest module.
+"""
+import io
+import math
+import os
+import sys
+import tempfile
+from importlib.util import find_spec
+
+import pandas as pd
+
+# Make the project root importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.ingest as ingest
+from src.ingest import filter_records, read_csv, read_csv_bytes, read_csv_frame
+
+HEADER = ("student_id,last_name,first_name,section,quiz1,quiz2,quiz3,quiz4,quiz5,"
+          "midterm,final,attendance_percent\n")
+
+MALFORMED = (HEADER
+             + "1001,Smith,John,A,85,90,88,92,87,85,88,95\n"
+             + "1002,Short,Row,B,70,70\n"
+             + "1003,Bad,Quiz,C,80,abc,90,90,90,90,90,90\n"
+             + "1004,Range,Final,A,80,80,80,80,80,80,120,90\n")
+
+
+def write_csv(text):
+    """Write CSV text to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False,
+                                     encoding='utf-8') as file:
+        file.write(text)
+    return file.name
+
+
+def test_read_csv():
+    """Test stdlib CSV reading and its csv.DictReader-compatible edge cases."""
+    # Blank lines are skipped and not counted in row numbers
+    path = write_csv(HEADER + "1001,Smith,John,A,85,90,88,92,87,85,88,95\n\n"
+                     + "1002,Jones,Amy,B,70,70,70,70,70,70,170,70\n")
+    try:
+        records, errors = read_csv(path)
+    finally:
+        os.remove(path)
+
+    assert [r['student_id'] for r in records] == ['1001', '1002']
+    assert records[0]['quiz1'] == 85.0
+    assert errors == ["Row 3: final out of range (0-100): 170.0"]
+
+    # The last duplicate header wins; absent columns read as empty
+    path = write_csv("student_id,quiz1,quiz1,section\n1001,10,20,A\n")
+    try:
+        records, errors = read_csv(path)
+    finally:
+        os.remove(path)
+
+    assert errors == []
+    assert records[0]['quiz1'] == 20.0
+    assert records[0]['section'] == 'A'
+    assert records[0]['last_name'] == '' and records[0]['final'] is None
+
+    # Fields missing from a short row read as None and fail validation
+    path = write_csv(HEADER + "1001,Smith,John,A,85\n")
+    try:
+        records, errors = read_csv(path)
+    finally:
+        os.remove(path)
+
+    assert records == []
+    assert errors == ["Row 2: Validation error: 'NoneType' object has no attribute 'strip'"]
+
+    # Missing files are reported
+    records, errors = read_csv('no_such_file.csv')
+    assert records == [] and errors == ["File not found: no_such_file.csv"]
+
+    print("✓ test_read_csv passed")
+
+
+def test_read_csv_frame_malformed_rows():
+    """Test that malformed rows are handled exactly as read_csv does."""
+    path = write_csv(MALFORMED)
+    try:
+        records, errors = read_csv(path)
+        frame, frame_errors = read_csv_frame(path, chunksize=2)
+    finally:
+        os.remove(path)
+
+    # Short rows are dropped; only the first bad field of a row is reported
+    assert errors == [
+        "Row 3: Validation error: 'NoneType' object has no attribute 'strip'",
+        "Row 4: Invalid quiz2 value: abc",
+        "Row 5: final out of range (0-100): 120.0",
+    ]
+    assert frame_errors == errors
+    assert [r['student_id'] for r in records] == ['1001', '1003', '1004']
+    assert frame['student_id'].tolist() == ['1001', '1003', '1004']
+
+    # Fields after the first bad one are left missing
+    assert 'quiz3' not in records[1]
+    assert frame['quiz1'][1] == 80.0
+    assert math.isnan(frame['quiz2'][1]) and math.isnan(frame['quiz3'][1])
+    assert math.isnan(frame['final'][2]) and math.isnan(frame['attendance_percent'][2])
+
+    # The last duplicate header wins, as in read_csv
+    path = write_csv("student_id,quiz1,quiz1,section\n1001,10,20,A\n")
+    try:
+        frames = [read_csv_frame(path), read_csv_frame(path, chunksize=1)]
+    finally:
+        os.remove(path)
+
+    for frame, frame_errors in frames:
+        assert frame_errors == []
+        assert frame['quiz1'].tolist() == [20.0]
+
+    print("✓ test_read_csv_frame_malformed_rows passed")
+
+
+def test_read_csv_frame_ragged_rows():
+    """Test that short and long rows do not reject the whole file."""
+    text = (HEADER
+            + "1001,Smith,John,A,85,90,88,92,87,85,88,95\n"
+            + "1002,Short,Row,B,70,70\n"
+            + "1003,Long,Row,C,80,80,80,80,80,80,80,80,99\n")
+    path = write_csv(text)
+    try:
+        records, errors = read_csv(path)
+        frame, frame_errors = read_csv_frame(path)
+    finally:
+        os.remove(path)
+
+    # The short row is reported and dropped; extra fields are ignored
+    assert errors == ["Row 3: Validation error: 'NoneType' object has no attribute 'strip'"]
+    assert [r['student_id'] for r in records] == ['1001', '1003']
+
+    assert frame_errors == errors
+    assert frame['student_id'].tolist() == ['1001', '1003']
+    assert frame['attendance_percent'].tolist() == [95.0, 80.0]
+
+    # Uploaded bytes and text streams take the same path
+    for frame, frame_errors in (read_csv_bytes(text.encode('utf-8')),
+                                read_csv_frame(io.StringIO(text)),
+                                read_csv_frame(io.StringIO(text), chunksize=1)):
+        assert frame_errors == errors
+        assert frame['student_id'].tolist() == ['1001', '1003']
+
+    print("✓ test_read_csv_frame_ragged_rows passed")
+
+
+def test_read_csv_frame_pyarrow():
+    """Test that pyarrow reads the exact CSV text that read_csv sees."""
+    if find_spec('pyarrow') is None:
+        print("- test_read_csv_frame_pyarrow skipped (pyarrow not installed)")
+        return
+
+    text = (HEADER
+            + "00123,Zero,Lead,01,85,90,88,92,87,85,88,95\n"
+            + "00124,Hex,Score,02,0x10,90,88,92,87,85,88,95\n"
+            + "00125,Nan,Score,01,nan,90,88,92,87,85,88,95\n"
+            + "00126,Long,Text,02,5.50,90,88,92,87,85,888.50,95\n")
+    path = write_csv(text)
+    has_pyarrow = ingest._HAS_PYARROW
+    ingest._HAS_PYARROW = True
+    try:
+        records, errors = read_csv(path)
+        frame, frame_errors = read_csv_frame(path)
+        uploaded, uploaded_errors = read_csv_bytes(text.encode('utf-8'))
+    finally:
+        ingest._HAS_PYARROW = has_pyarrow
+        os.remove(path)
+
+    # Values are not type-inferred: leading zeros and raw text survive
+    assert errors == [
+        "Row 3: Invalid quiz1 value: 0x10",
+        "Row 4: quiz1 out of range (0-100): nan",
+        "Row 5: final out of range (0-100): 888.5",
+    ]
+    assert frame_errors == errors and uploaded_errors == errors
+    assert frame['student_id'].tolist() == [r['student_id'] for r in records]
+    assert frame['student_id'].tolist() == ['00123', '00124', '00125', '00126']
+    assert frame['section'].tolist() == ['01', '02', '01', '02']
+    assert frame['quiz1'][3] == 5.5
+    assert uploaded.equals(frame)
+
+    # The last duplicate header wins, as in read_csv
+    path = write_csv("student_id,quiz1,quiz1,section\n1001,10,20,A\n")
+    ingest._HAS_PYARROW = True
+    try:
+        frame, frame_errors = read_csv_frame(path)
+    finally:
+        ingest._HAS_PYARROW = has_pyarrow
+        os.remove(path)
+
+    assert frame_errors == []
+    assert frame['quiz1'].tolist() == [20.0]
+    assert frame['section'].tolist() == ['A']
+
+    print("✓ test_read_csv_frame_pyarrow passed")
+
+
+def test_read_csv_frame_chunks():
+    """Test that chunked, partial and whole-file reads agree with read_csv."""
+    rows = [f"{1000 + i},Last{i},First{i},{'AB'[i % 2]},80,80,80,80,80,70,{60 + i},90,note{i}\n"
+            for i in range(7)]
+    rows[4] = "1004,Bad,Row,A,80,80,80,80,80,70,64,x,note\n"
+    rows[6] = ",Missing,Id,B,80,80,80,80,80,70,66,90,note\n"
+
+    # A whitespace-only line is a row, a blank line is skipped
+    rows[2:2] = [" \n"]
+    rows[7:7] = ["\n"]
+    path = write_csv(HEADER.replace("\n", ",notes\n") + "".join(rows))
+
+    try:
+        records, read_errors = read_csv(path)
+        frame, errors = read_csv_frame(path)
+        chunked = [read_csv_frame(path, chunksize=size) for size in (1, 2, 3, 100)]
+        partial, partial_errors = read_csv_frame(path, nrows=6)
+    finally:
+        os.remove(path)
+
+    # Row numbers continue across chunks; unknown columns are not read
+    assert errors == read_errors == ["Row 4: Missing student_id",
+                                     "Row 7: Invalid attendance_percent value: x",
+                                     "Row 9: Missing student_id"]
+    assert frame['student_id'].tolist() == [r['student_id'] for r in records]
+    assert frame['student_id'].tolist() == ['1000', '1001', '1002', '1003', '1004', '1005']
+    assert 'notes' not in frame.columns
+    assert frame['final'].tolist() == [60.0, 61.0, 62.0, 63.0, 64.0, 65.0]
+
+    for chunk_frame, chunk_errors in chunked:
+        assert chunk_errors == errors
+        assert chunk_frame.equals(frame)
+
+    # nrows reads only the leading rows
+    assert partial_errors == ["Row 4: Missing student_id",
+                              "Row 7: Invalid attendance_percent value: x"]
+    assert partial['student_id'].tolist() == ['1000', '1001', '1002', '1003', '1004']
+
+    print("✓ test_read_csv_frame_chunks passed")
+
+
+def test_filter_records():
+    """Test filtering lists per record and DataFrames with a boolean mask."""
+    records = [{'student_id': '1001', 'section': 'A', 'final_grade': 91.0},
+               {'student_id': '1002', 'section': 'B', 'final_grade': None},
+               {'student_id': '1003', 'section': 'A', 'final_grade': 55.0}]
+    frame = pd.DataFrame(records)
+
+    # Column-wise predicates work on either representation
+    listed = filter_records(records, lambda r: r['section'] == 'A')
+    masked = filter_records(frame, lambda r: r['section'] == 'A')
+    assert [r['student_id'] for r in listed] == ['1001', '1003']
+    assert masked['student_id'].tolist() == ['1001', '1003']
+    assert filter_records(frame, lambda r: r['final_grade'] < 60)['student_id'].tolist() == ['1003']
+
+    # A per-record predicate is not a mask on a frame
+    assert len(filter_records(records, lambda r: r['final_grade'] is not None)) == 2
+    try:
+        filter_records(frame, lambda r: r['final_grade'] is not None)
+    except TypeError as e:
+        assert "boolean Series" in str(e)
+    else:
+        raise AssertionError("expected TypeError")
+
+    print("✓ test_filter_records passed")
+
+
+if __name__ == "__main__":
+    test_read_csv()
+    test_read_csv_frame_malformed_rows()
+    test_read_csv_frame_ragged_rows()
+    test_read_csv_frame_pyarrow()
+    test_read_csv_frame_chunks()
+    test_filter_records()
+    print("\n✓ All ingest tests passed!")
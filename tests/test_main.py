@@ -0,0 +1,45 @@
+"""
+Unit tests for the main pipeline.
+"""
+import json
+import os
+import sys
+import tempfile
+
+# Make the project root importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import load_config
+
+
+def test_load_config():
+    """Test that cached configs are fresh copies and track file edits."""
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False,
+                                     encoding='utf-8') as file:
+        json.dump({'thresholds': {'at_risk': 60}}, file)
+    path = file.name
+
+    try:
+        # Each call gets its own copy; mutating one leaves the cache intact
+        first = load_config(path)
+        first['thresholds']['at_risk'] = 0
+        second = load_config(path)
+        assert second == {'thresholds': {'at_risk': 60}}
+        assert second is not first
+        assert second['thresholds'] is not first['thresholds']
+
+        # Editing the file (a new modification time) invalidates the cache
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'thresholds': {'at_risk': 50}}, file)
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+        assert load_config(path) == {'thresholds': {'at_risk': 50}}
+    finally:
+        os.remove(path)
+
+    print("✓ test_load_config passed")
+
+
+if __name__ == "__main__":
+    test_load_config()
+    print("\n✓ All main tests passed!")
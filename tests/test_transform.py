@@ -1,12 +1,17 @@
 """
 Unit tests for transform module.
 """
-from src.transform import (compute_quiz_average, compute_final_grade,
-                           letter_grade, compute_improvement)
-import sys
 import os
+import sys
+
+import pandas as pd
+
+# Make the project root importable when run as a script
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.transform import (compute_quiz_average, compute_final_grade,
+                           letter_grade, compute_improvement, add_computed_fields)
+
 
 def test_compute_quiz_average():
     """Test quiz average calculation."""
@@ -65,6 +70,21 @@ def test_letter_grade():
     assert letter_grade(65, grade_scale) == 'D'
     assert letter_grade(55, grade_scale) == 'F'
     assert letter_grade(None, grade_scale) == 'N/A'
+    assert letter_grade(float('nan'), grade_scale) == 'F'
+
+    # Equal thresholds resolve to the first letter, in both code paths
+    tied_scale = {'A': 90, 'A+': 90, 'B': 80, 'F': 0}
+    assert letter_grade(95, tied_scale) == 'A'
+
+    frame = pd.DataFrame([{field: 95.0 for field in
+                           ['quiz1', 'quiz2', 'quiz3', 'quiz4', 'quiz5',
+                            'midterm', 'final', 'attendance_percent']}])
+    weights = {'quizzes': 0.20, 'midterm': 0.30, 'final': 0.40, 'attendance': 0.10}
+    assert add_computed_fields(frame, weights, tied_scale)['letter_grade'][0] == 'A'
+
+    # An empty scale grades everyone 'F'
+    assert letter_grade(95, {}) == 'F'
+    assert add_computed_fields(frame, weights, {})['letter_grade'][0] == 'F'
 
     print("✓ test_letter_grade passed")
 
@@ -88,9 +108,51 @@ def test_compute_improvement():
     print("✓ test_compute_improvement passed")
 
 
+def test_add_computed_fields_frame():
+    """Test vectorized computed fields match the per-record functions."""
+    weights = {'quizzes': 0.20, 'midterm': 0.30,
+               'final': 0.40, 'attendance': 0.10}
+    grade_scale = {'A': 90, 'B': 80, 'C': 70, 'D': 60, 'F': 0}
+    records = [
+        {'quiz1': 80, 'quiz2': 85, 'quiz3': 90, 'quiz4': 85, 'quiz5': 80,
+         'midterm': 85, 'final': 88, 'attendance_percent': 95},
+        {'quiz1': None, 'quiz2': None, 'quiz3': None, 'quiz4': None, 'quiz5': None,
+         'midterm': 60, 'final': 50, 'attendance_percent': None},
+        {'quiz1': 80, 'quiz2': 85, 'quiz3': 90, 'quiz4': 85, 'quiz5': 80,
+         'midterm': None, 'final': 88, 'attendance_percent': 95},
+        {'quiz1': 0, 'quiz2': 51.97355, 'quiz3': None, 'quiz4': 88.1, 'quiz5': 23.61,
+         'midterm': 70, 'final': 75, 'attendance_percent': 90},
+    ]
+    frame = pd.DataFrame(records, dtype='float64')
+
+    result = add_computed_fields(frame, weights, grade_scale)
+    expected = add_computed_fields(records, weights, grade_scale)
+
+    assert result['final_grade'][0] == expected[0]['final_grade']
+    assert result['final_grade'][1] == expected[1]['final_grade']
+    assert pd.isna(result['final_grade'][2])
+    assert pd.isna(result['quiz_average'][1])
+
+    # Quizzes are summed in the same order, so a missing quiz does not
+    # change the rounding, whatever the frame's memory layout
+    single = add_computed_fields(frame[3:], weights, grade_scale)
+    for computed in (result, single):
+        assert computed['quiz_average'][3] == expected[3]['quiz_average']
+        assert computed['final_grade'][3] == expected[3]['final_grade']
+    assert result['letter_grade'].tolist() == [r['letter_grade'] for r in expected]
+    assert result['improvement'][1] == expected[1]['improvement']
+    assert pd.isna(result['improvement'][2])
+
+    # Input frame is left untouched
+    assert 'final_grade' not in frame.columns
+
+    print("✓ test_add_computed_fields_frame passed")
+
+
 if __name__ == "__main__":
     test_compute_quiz_average()
     test_compute_final_grade()
     test_letter_grade()
     test_compute_improvement()
+    test_add_computed_fields_frame()
     print("\n✓ All transform tests passed!")